@@ -1,17 +1,37 @@
+import hashlib
 import re
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Iterable, List, Optional, Dict, Any, Tuple
 
-@dataclass
+import ahocorasick
+
+@dataclass(slots=True, frozen=True)
 class ScoringResult:
     bucket: str  # "HIGH_CERTAINTY" | "LESS_CERTAIN" | "EXCLUDE"
     score: int
-    reasons: List[str]
+    reasons: Tuple[str, ...]
     exclude_reason: Optional[str] = None
     parsed_years_min: Optional[float] = None
     parsed_years_max: Optional[float] = None
 
 
+# Shared results for the hard excludes that carry no per-posting detail
+_EXCLUDE_SENIOR_TITLE = ScoringResult(
+    bucket="EXCLUDE",
+    score=-999,
+    reasons=(),
+    exclude_reason="Senior title/level keyword"
+)
+
+_EXCLUDE_SENIOR_LANGUAGE = ScoringResult(
+    bucket="EXCLUDE",
+    score=-999,
+    reasons=(),
+    exclude_reason="Senior language in description"
+)
+
+
 SENIOR_TITLE_EXCLUDES = [
     "senior", "lead", "manager", "principal", "head", "director", "vp",
     "vice president", "chief", "c-level", "partner"
@@ -44,13 +64,86 @@ SENIOR_LANGUAGE_EXCLUDES = [
     "strategic ownership", "lead a team", "line manage", "people management"
 ]
 
+TRAINING_TEXT = [
+    "training provided", "full training", "we will train",
+    "learning and development", "development opportunity"
+]
+
+POSITIVE_VERBS = [
+    "assist", "support", "coordinate", "help", "learn", "shadow", "contribute", "maintain"
+]
+
+NEGATIVE_VERBS = [
+    "lead", "own", "drive strategy", "set strategy", "define roadmap", "manage a team", "line manage"
+]
+
+# Experience-year patterns, compiled once at import.
+# "1-2 years", "1 – 2 years", "0 to 2 years"
+_RANGE_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(?:-|–|to)\s*(\d+(?:\.\d+)?)\s*(?:\+?\s*)?years?", re.I)
+# "up to 2 years"
+_UPTO_RE = re.compile(r"up to\s*(\d+(?:\.\d+)?)\s*years?", re.I)
+# "2+ years", "3+ years"
+_PLUS_RE = re.compile(r"(\d+(?:\.\d+)?)\s*\+\s*years?", re.I)
+# "at least 2 years", "minimum of 1 year"
+_ATLEAST_RE = re.compile(r"(?:at least|min(?:imum)?(?: of)?)\s*(\d+(?:\.\d+)?)\s*years?", re.I)
+
 
 def _norm(s: Optional[str]) -> str:
     return (s or "").strip().lower()
 
 
-def _contains_any(haystack: str, needles: List[str]) -> bool:
-    return any(n in haystack for n in needles)
+def _build_automaton(keywords: Iterable[str]) -> ahocorasick.Automaton:
+    auto = ahocorasick.Automaton()
+    for k in keywords:
+        auto.add_word(k, k)
+    auto.make_automaton()
+    return auto
+
+
+# One Aho-Corasick automaton per keyword set: each check is a single linear
+# scan of the field regardless of how many keywords the set holds.
+_SENIOR_TITLE_AC = _build_automaton(SENIOR_TITLE_EXCLUDES)
+_STRONG_POSITIVE_TITLE_AC = _build_automaton(STRONG_POSITIVE_TITLE)
+_STEALTH_JUNIOR_TITLE_AC = _build_automaton(STEALTH_JUNIOR_TITLE)
+
+
+def _build_tagged_automaton(keyword_sets: Dict[str, List[str]]) -> ahocorasick.Automaton:
+    """One automaton over several keyword sets, tagging each keyword with its set names."""
+    tags: Dict[str, List[str]] = {}
+    for name, keywords in keyword_sets.items():
+        for k in keywords:
+            tags.setdefault(k, []).append(name)
+
+    auto = ahocorasick.Automaton()
+    for k, names in tags.items():
+        auto.add_word(k, (k, tuple(names)))
+    auto.make_automaton()
+    return auto
+
+
+# Description keyword sets (responsibility verbs included) share one
+# automaton, so a single scan of the description answers every check,
+# including the senior-language exclude, before any year parsing runs.
+_DESC_AC = _build_tagged_automaton({
+    "senior_language": SENIOR_LANGUAGE_EXCLUDES,
+    "strong_text": STRONG_POSITIVE_TEXT,
+    "training": TRAINING_TEXT,
+    "internship": INTERNSHIP_EQUIVALENT_TEXT,
+    "pos_verbs": POSITIVE_VERBS,
+    "neg_verbs": NEGATIVE_VERBS,
+})
+
+
+def _contains_any(haystack: str, auto: ahocorasick.Automaton) -> bool:
+    return next(auto.iter(haystack), None) is not None
+
+
+def _count_hits(haystack: str, auto: ahocorasick.Automaton) -> Counter:
+    """Count distinct keywords found in `haystack`, per keyword set of a tagged automaton."""
+    found: Dict[str, Tuple[str, ...]] = {}
+    for _, (k, names) in auto.iter(haystack):
+        found[k] = names
+    return Counter(name for names in found.values() for name in names)
 
 
 def _extract_years(text: str) -> Tuple[Optional[float], Optional[float], List[str]]:
@@ -61,35 +154,26 @@ def _extract_years(text: str) -> Tuple[Optional[float], Optional[float], List[st
     evidence = []
     t = text
 
-    # Common patterns:
-    # "1-2 years", "1 – 2 years", "0 to 2 years"
-    range_pat = re.compile(r"(\d+(?:\.\d+)?)\s*(?:-|–|to)\s*(\d+(?:\.\d+)?)\s*(?:\+?\s*)?years?", re.I)
-    m = range_pat.search(t)
+    m = _RANGE_RE.search(t)
     if m:
         mn = float(m.group(1))
         mx = float(m.group(2))
         evidence.append(f"Years range: {mn:g}-{mx:g}")
         return mn, mx, evidence
 
-    # "up to 2 years"
-    upto_pat = re.compile(r"up to\s*(\d+(?:\.\d+)?)\s*years?", re.I)
-    m = upto_pat.search(t)
+    m = _UPTO_RE.search(t)
     if m:
         mx = float(m.group(1))
         evidence.append(f"Years: up to {mx:g}")
         return 0.0, mx, evidence
 
-    # "2+ years", "3+ years"
-    plus_pat = re.compile(r"(\d+(?:\.\d+)?)\s*\+\s*years?", re.I)
-    m = plus_pat.search(t)
+    m = _PLUS_RE.search(t)
     if m:
         mn = float(m.group(1))
         evidence.append(f"Years: {mn:g}+")
         return mn, None, evidence
 
-    # "at least 2 years", "minimum of 1 year"
-    atleast_pat = re.compile(r"(?:at least|min(?:imum)?(?: of)?)\s*(\d+(?:\.\d+)?)\s*years?", re.I)
-    m = atleast_pat.search(t)
+    m = _ATLEAST_RE.search(t)
     if m:
         mn = float(m.group(1))
         evidence.append(f"Years: at least {mn:g}")
@@ -98,6 +182,12 @@ def _extract_years(text: str) -> Tuple[Optional[float], Optional[float], List[st
     return None, None, evidence
 
 
+# Memo of scored postings, keyed on (title, description digest, seniority) so
+# the cache never holds whole descriptions. Bounded, least recently used out.
+_SCORE_CACHE: "OrderedDict[Tuple[str, bytes, str], ScoringResult]" = OrderedDict()
+_SCORE_CACHE_SIZE = 4096
+
+
 def score_grad_suitability(
     title: str,
     description: str = "",
@@ -108,31 +198,39 @@ def score_grad_suitability(
     Returns:
       - EXCLUDE if clearly senior
       - otherwise HIGH_CERTAINTY or LESS_CERTAIN based on score and strong signals
+
+    Results are memoised on the normalised title, a digest of the description
+    and the seniority, so reposted or duplicated jobs are scored once. The returned ScoringResult
+    may be shared between callers: treat it as read-only.
     """
     t = _norm(title)
     d = _norm(description)
-    dep = _norm(department)
     lvl = _norm(seniority)
 
+    key = (t, hashlib.blake2b(d.encode(), digest_size=16).digest(), lvl)
+    res = _SCORE_CACHE.get(key)
+    if res is not None:
+        _SCORE_CACHE.move_to_end(key)
+        return res
+
+    res = _score_normalised(t, d, lvl)
+    _SCORE_CACHE[key] = res
+    if len(_SCORE_CACHE) > _SCORE_CACHE_SIZE:
+        _SCORE_CACHE.popitem(last=False)
+    return res
+
+
+def _score_normalised(t: str, d: str, lvl: str) -> ScoringResult:
     reasons: List[str] = []
     score = 0
 
     # ---- HARD EXCLUDES ----
-    if _contains_any(t, SENIOR_TITLE_EXCLUDES) or _contains_any(lvl, SENIOR_TITLE_EXCLUDES):
-        return ScoringResult(
-            bucket="EXCLUDE",
-            score=-999,
-            reasons=[],
-            exclude_reason="Senior title/level keyword"
-        )
+    if _contains_any(t, _SENIOR_TITLE_AC) or _contains_any(lvl, _SENIOR_TITLE_AC):
+        return _EXCLUDE_SENIOR_TITLE
 
-    if _contains_any(d, SENIOR_LANGUAGE_EXCLUDES):
-        return ScoringResult(
-            bucket="EXCLUDE",
-            score=-999,
-            reasons=[],
-            exclude_reason="Senior language in description"
-        )
+    d_hits = _count_hits(d, _DESC_AC)
+    if "senior_language" in d_hits:
+        return _EXCLUDE_SENIOR_LANGUAGE
 
     # Parse years
     years_min, years_max, years_evidence = _extract_years(d)
@@ -144,33 +242,35 @@ def score_grad_suitability(
         return ScoringResult(
             bucket="EXCLUDE",
             score=-999,
-            reasons=reasons,
+            reasons=tuple(reasons),
             exclude_reason="Minimum experience 5+ years",
             parsed_years_min=years_min,
             parsed_years_max=years_max
         )
 
     # ---- POSITIVE TITLE SIGNALS ----
-    if any(k in t for k in STRONG_POSITIVE_TITLE):
+    strong_title = _contains_any(t, _STRONG_POSITIVE_TITLE_AC)
+    if strong_title:
         score += 2
         reasons.append("Strong junior title signal")
 
     # Stealth titles: only weak-positive (need supporting evidence elsewhere)
-    if any(k in t for k in STEALTH_JUNIOR_TITLE):
+    if _contains_any(t, _STEALTH_JUNIOR_TITLE_AC):
         score += 1
         reasons.append("Stealth junior title (needs evidence)")
 
     # ---- POSITIVE TEXT SIGNALS ----
-    if _contains_any(d, STRONG_POSITIVE_TEXT):
+    strong_text = "strong_text" in d_hits
+    if strong_text:
         score += 2
         reasons.append("Explicit entry-level / graduate language")
 
-    if _contains_any(d, ["training provided", "full training", "we will train", "learning and development", "development opportunity"]):
+    if "training" in d_hits:
         score += 1
         reasons.append("Training/development language")
 
     # Internship-equivalent override (important for your use case)
-    internship_equiv = _contains_any(d, INTERNSHIP_EQUIVALENT_TEXT)
+    internship_equiv = "internship" in d_hits
     if internship_equiv:
         score += 2
         reasons.append("Internship/part-time/uni-project experience accepted")
@@ -203,10 +303,8 @@ def score_grad_suitability(
         reasons.append("No explicit years found")
 
     # ---- RESPONSIBILITY VERB HEURISTIC (light touch) ----
-    positive_verbs = ["assist", "support", "coordinate", "help", "learn", "shadow", "contribute", "maintain"]
-    negative_verbs = ["lead", "own", "drive strategy", "set strategy", "define roadmap", "manage a team", "line manage"]
-    pos_hits = sum(1 for v in positive_verbs if v in d)
-    neg_hits = sum(1 for v in negative_verbs if v in d)
+    pos_hits = d_hits["pos_verbs"]
+    neg_hits = d_hits["neg_verbs"]
 
     if pos_hits >= 2:
         score += 1
@@ -218,8 +316,8 @@ def score_grad_suitability(
     # ---- BUCKETING ----
     # Strong-positive triggers for HIGH_CERTAINTY
     strong_positive = (
-        any(k in t for k in STRONG_POSITIVE_TITLE)
-        or _contains_any(d, STRONG_POSITIVE_TEXT)
+        strong_title
+        or strong_text
         or (years_max is not None and years_max <= 2)
         or internship_equiv
     )
@@ -234,7 +332,7 @@ def score_grad_suitability(
     return ScoringResult(
         bucket=bucket,
         score=score,
-        reasons=reasons,
+        reasons=tuple(reasons),
         exclude_reason=None,
         parsed_years_min=years_min,
         parsed_years_max=years_max
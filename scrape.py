@@ -1,7 +1,9 @@
+import csv
 import re
-import pandas as pd
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
 
 from scoring import score_grad_suitability
 
@@ -11,17 +13,37 @@ HEADERS = {
     "User-Agent": "grad-job-scraper (personal project; respectful rate-limited)"
 }
 
+# Shared session: keeps connections alive across requests instead of a fresh
+# TCP/TLS handshake per call.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
 UK_LOCATION_HINTS = {
     "gb", "uk", "united kingdom",
     "london", "manchester", "leeds", "bristol", "birmingham", "glasgow", "edinburgh", "belfast"
 }
 
+# Any hint as a whole word, in one scan
+_UK_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, sorted(UK_LOCATION_HINTS))) + r")\b")
+
+OUTPUT_CSV = "jobs_output.csv"
+OUTPUT_FIELDS = [
+    "title", "bucket", "score", "years_min", "years_max",
+    "department", "location", "employment_type", "url", "reasons",
+]
+
+# Pinpoint splits the JD across several HTML fields
+DESCRIPTION_FIELDS = ("description", "key_responsibilities", "skills_knowledge_expertise")
+
 def html_to_text(html: str) -> str:
     if not html:
         return ""
-    soup = BeautifulSoup(html, "html.parser")
-    text = soup.get_text(" ", strip=True)
-    return re.sub(r"\s+", " ", text).strip()
+    body = LexborHTMLParser(html).body
+    if body is None:
+        return ""
+    text = body.text(separator=" ", strip=True)
+    return " ".join(text.split())
 
 def is_uk_role(location_name: str) -> bool:
     """
@@ -29,29 +51,58 @@ def is_uk_role(location_name: str) -> bool:
     We'll keep anything that looks UK-ish.
     """
     loc = (location_name or "").strip().lower()
-    if loc.startswith("gb") or "united kingdom" in loc:
-        return True
-    return any(hint in loc for hint in UK_LOCATION_HINTS)
+    return bool(_UK_RE.search(loc))
 
 def fetch_cfc_postings() -> list[dict]:
-    r = requests.get(CFC_POSTINGS_URL, headers=HEADERS, timeout=30)
+    r = SESSION.get(CFC_POSTINGS_URL, timeout=30)
     r.raise_for_status()
-    payload = r.json()
+    payload = orjson.loads(r.content)
     return payload.get("data", [])
 
 def main():
     postings = fetch_cfc_postings()
 
-    rows = []
-    for p in postings:
-        title = p.get("title", "")
-        url = p.get("url", "")
-        department = (p.get("department") or {}).get("name", "")
-        location_name = (p.get("location") or {}).get("name", "")
-        employment_type = p.get("employment_type_text", "") or p.get("employment_type", "")
+    # Stream each kept row straight to disk rather than buffering them all
+    kept = 0
+    with open(OUTPUT_CSV, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=OUTPUT_FIELDS)
+        writer.writeheader()
+
+        for p in postings:
+            title = p.get("title", "")
+            url = p.get("url", "")
+            department = (p.get("department") or {}).get("name", "")
+            location_name = (p.get("location") or {}).get("name", "")
+            employment_type = p.get("employment_type_text", "") or p.get("employment_type", "")
+
+            # UK-only filter
+            if not is_uk_role(location_name):
+                continue
+
+            # Combine key sections so the scorer has enough context
+            description = " ".join(
+                html_to_text(p.get(field) or "") for field in DESCRIPTION_FIELDS
+            ).strip()
+
+            res = score_grad_suitability(title, description, department=department)
+            if res.bucket == "EXCLUDE":
+                continue
+
+            writer.writerow({
+                "title": title,
+                "bucket": res.bucket,
+                "score": res.score,
+                "years_min": res.parsed_years_min,
+                "years_max": res.parsed_years_max,
+                "department": department,
+                "location": location_name,
+                "employment_type": employment_type,
+                "url": url,
+                "reasons": "; ".join(res.reasons),
+            })
+            kept += 1
 
-        # UK-only filter
-        if not is_uk_role(location_name):
-            continue
+    print(f"Kept {kept} of {len(postings)} postings -> {OUTPUT_CSV}")
 
-        # Combine key sections so the scorer has
+if __name__ == "__main__":
+    main()